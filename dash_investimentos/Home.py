@@ -1,5 +1,7 @@
 import streamlit as st
 
+from warmup import warm_up_server
+
 st.set_page_config(
     page_title="Início | Simulador de Investimentos",
     page_icon="🏠",
@@ -39,5 +41,14 @@ with col2:
     *(Página em desenvolvimento)*
     """)
 
+st.subheader("⚖️ Mix de Financiamento")
+st.markdown("""
+Entre os dois extremos, a página **"Mix de Financiamento"** simula de uma só vez todas as combinações: de 0% a 100% da obra financiada pelo consórcio, com o terreno sempre pago com capital próprio. O gráfico de resultado líquido e TIR mostra imediatamente qual estrutura rende mais.
+""")
+
 st.markdown("---")
-st.info("💡 **Dica:** Preencha os parâmetros com atenção em cada página para obter uma comparação precisa e que reflita sua realidade. Os resultados de cada simulação poderão ser comparados na página de **Resumo**.", icon="💡")
\ No newline at end of file
+st.info("💡 **Dica:** Preencha os parâmetros com atenção em cada página para obter uma comparação precisa e que reflita sua realidade. Os resultados de cada simulação poderão ser comparados na página de **Resumo**.", icon="💡")
+
+# --- PRÉ-AQUECIMENTO ---
+# Executado depois de exibir o conteúdo: deixa os cenários padrão das páginas prontos no cache.
+warm_up_server()
@@ -0,0 +1,82 @@
+"""
+Suíte de benchmarks do simulador.
+
+Executar a partir de `dash_investimentos/`:
+
+    python -m benchmarks                                   # motor + sessões, salva em benchmarks/results/latest.json
+    python -m benchmarks --skip-sessions                   # motor + relatório de tempo de importação
+    python -m benchmarks --sessions 50 --concurrency 8     # carga com 50 sessões por página
+    python -m benchmarks --baseline benchmarks/results/main.json --tolerance 0.25
+
+Com `--baseline`, o processo termina com código 1 se alguma métrica piorar além
+da tolerância permitida (latência, memória ou vazão) ou se alguma sessão tiver erros.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import bench_engine, bench_sessions, import_time
+from benchmarks.common import RESULTS_DIR, environment, find_regressions, save_results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks do simulador de investimentos.")
+    parser.add_argument("--skip-engine", action="store_true", help="Não executa os micro-benchmarks do motor.")
+    parser.add_argument("--skip-imports", action="store_true", help="Não executa o relatório de tempo de importação.")
+    parser.add_argument("--skip-sessions", action="store_true", help="Não executa o teste de carga com sessões simuladas.")
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(bench_engine.HORIZONS), help="Horizontes (meses) dos micro-benchmarks.")
+    parser.add_argument("--grid-rows", type=int, default=bench_engine.GRID_ROWS, help="Cenários salvos nos benchmarks da tabela (0 para pular).")
+    parser.add_argument("--sessions", type=int, default=50, help="Sessões simuladas por página.")
+    parser.add_argument("--concurrency", type=int, default=None, help="Sessões simultâneas, em threads de um só processo (padrão: número de CPUs).")
+    parser.add_argument("--steps", type=int, default=10, help="Interações por sessão.")
+    parser.add_argument("--output", default=str(RESULTS_DIR / "latest.json"), help="Arquivo JSON de saída.")
+    parser.add_argument("--baseline", help="Relatório JSON de referência para detectar regressões.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Piora relativa tolerada (0.25 = 25%%).")
+    args = parser.parse_args(argv)
+
+    results = {'environment': environment()}
+    if not args.skip_engine:
+        print("Executando micro-benchmarks do motor...", flush=True)
+        results['engine'] = bench_engine.run(args.horizons, grid_rows=args.grid_rows)
+        for case, stats in results['engine'].items():
+            print(f"  {case:<45} p50 {stats['p50_ms']:9.3f} ms")
+
+    if not args.skip_imports:
+        print("Medindo tempo de importação...", flush=True)
+        results['imports'] = import_time.run()
+        startup = results['imports']['startup']
+        print(f"  inicialização ({', '.join(startup['modules'])}): {startup['total_ms']:.0f} ms")
+        for package, ms in startup['dominant_packages_ms'].items():
+            print(f"    {package:<30} {ms:8.1f} ms")
+        loaded = ", ".join(startup['deferred_loaded_at_startup']) or "nenhuma"
+        print(f"  bibliotecas pesadas carregadas na inicialização: {loaded}")
+        for module, ms in results['imports']['deferred_ms'].items():
+            print(f"  sob demanda: {module:<28} {ms:8.1f} ms")
+
+    if not args.skip_sessions:
+        print(f"Simulando {args.sessions} sessões por página...", flush=True)
+        results['sessions'] = bench_sessions.run(args.sessions, args.concurrency, args.steps)
+        for page, stats in results['sessions']['pages'].items():
+            rerun = stats['rerun']
+            print(f"  {page:<18} rerun p50 {rerun['p50_ms']:.1f} ms | p95 {rerun['p95_ms']:.1f} ms | p99 {rerun['p99_ms']:.1f} ms"
+                  f" | pico RSS {stats['peak_rss_mb']:.0f} MB | {stats['throughput_reruns_per_s']:.1f} reruns/s"
+                  f" | erros {stats['errors']}")
+
+    path = save_results(results, args.output)
+    print(f"Resultados salvos em {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressões detectadas:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("Nenhuma regressão em relação à referência.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
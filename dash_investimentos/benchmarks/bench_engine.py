@@ -0,0 +1,116 @@
+import timeit
+
+from benchmarks.common import default_params, summarize
+
+from calculations import (
+    calculate_consortium_operation, calculate_funding_mix, calculate_progressive_tax, calculate_scenario_1,
+    calculate_scenario_2, format_currency
+)
+import charts
+import scenario_grid
+from scenarios import CAPITAL_PROPRIO, CONSORCIO, MIX_FINANCIAMENTO, best_funding_mix_rows
+
+HORIZONS = (6, 18, 60, 120, 360)
+GRID_ROWS = 100_000
+
+
+def time_call(func, repeat=7, min_time=0.05):
+    """
+    Mede o tempo por chamada de `func` (ms). Cada amostra executa a função
+    quantas vezes forem necessárias para somar ao menos `min_time` segundos.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return summarize([t / number * 1000 for t in timer.repeat(repeat=repeat, number=number)])
+
+
+def horizon_cases(months):
+    """Casos de benchmark (nome, função sem argumentos) para um horizonte em meses."""
+    params_s2 = default_params(CAPITAL_PROPRIO, months)
+    params_consorcio = default_params(CONSORCIO, months)
+    params_mix = default_params(MIX_FINANCIAMENTO, months)
+
+    final_s1, _, history_s1 = calculate_scenario_1(params_s2['initial_investment'], params_s2['monthly_rate'], months)
+    final_s2, history_s2, tax_details, _, _, _ = calculate_scenario_2(params_s2)
+    s2_timeline = history_s2.rename(columns={'Saldo do Fundo (R$)': 'Evolução Construção (R$)'})
+    economia = tax_details['Economia de Imposto (Empresa)']
+
+    land = params_consorcio['land_cost']
+    final_land_s1, _, history_land_s1 = calculate_scenario_1(land, params_consorcio['monthly_rate'], months)
+    final_consorcio, details, history_consorcio = calculate_consortium_operation(params_consorcio)
+
+    mix_df = calculate_funding_mix(params_mix)
+    best_mix_rows = best_funding_mix_rows(mix_df)
+
+    return [
+        ('calculate_scenario_1', lambda: calculate_scenario_1(params_s2['initial_investment'], params_s2['monthly_rate'], months)),
+        ('calculate_scenario_2', lambda: calculate_scenario_2(params_s2)),
+        ('calculate_consortium_operation', lambda: calculate_consortium_operation(params_consorcio)),
+        ('calculate_funding_mix', lambda: calculate_funding_mix(params_mix)),
+        ('build_growth_figure', lambda: charts.build_growth_figure(history_s1, months)),
+        ('build_evolution_figure', lambda: charts.build_evolution_figure(history_s1, s2_timeline)),
+        ('build_tax_benefit_figure', lambda: charts.build_tax_benefit_figure(economia, params_s2['initial_investment'] - economia)),
+        ('build_final_comparison_figure', lambda: charts.build_final_comparison_figure(final_s1, final_s2 + economia)),
+        ('build_land_growth_figure', lambda: charts.build_land_growth_figure(history_land_s1)),
+        ('build_cash_flow_figure', lambda: charts.build_cash_flow_figure(history_land_s1, history_consorcio, details, months)),
+        ('build_profit_comparison_figure', lambda: charts.build_profit_comparison_figure(final_land_s1 - land, final_consorcio - land)),
+        ('build_funding_mix_figure', lambda: charts.build_funding_mix_figure(mix_df, 12.0, *best_mix_rows)),
+    ]
+
+
+def grid_cases(rows):
+    """Casos da tabela de cenários salvos com `rows` cenários sintéticos, variando prazo, custo e venda."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    investment = rng.integers(5, 60, rows) * 100_000.0
+    fixed_income = investment * rng.uniform(1.05, 1.6, rows)
+    construction = fixed_income + rng.normal(0, 400_000, rows)
+    scenarios = [
+        {
+            scenario_grid.INVESTMENT: i, scenario_grid.FIXED_INCOME: f, scenario_grid.CONSTRUCTION: c,
+            scenario_grid.DIFFERENCE: c - f, scenario_grid.MONTHS: m, scenario_grid.SALE_VARIATION: sv,
+            scenario_grid.COST_VARIATION: cv,
+        }
+        for i, f, c, m, sv, cv in zip(
+            investment.tolist(), fixed_income.tolist(), construction.tolist(),
+            rng.choice(HORIZONS, rows).tolist(), rng.integers(-20, 21, rows).tolist(), rng.integers(-20, 21, rows).tolist()
+        )
+    ]
+    df = scenario_grid.scenarios_frame(scenarios, {})
+    state = {}
+    scenario_grid.scenarios_frame(scenarios, state)
+
+    def rerun():
+        # Caminho de cada interação com a tabela: filtro, ordenação, resumo e formatação da página visível.
+        filtered = scenario_grid.filter_scenarios(scenario_grid.scenarios_frame(scenarios, state), [18, 60], 0.0)
+        scenario_grid.summarize_scenarios(filtered)
+        scenario_grid.format_table(scenario_grid.average_by_horizon(filtered))
+        return scenario_grid.format_table(scenario_grid.page_of(filtered, scenario_grid.DIFFERENCE, False, 2, 50))
+
+    return [
+        ('scenarios_frame', lambda: scenario_grid.scenarios_frame(scenarios, {})),
+        ('filter_scenarios', lambda: scenario_grid.filter_scenarios(df, [18, 60], 0.0)),
+        ('page_of', lambda: scenario_grid.page_of(df, scenario_grid.DIFFERENCE, False, 2, 50)),
+        ('summarize_scenarios', lambda: scenario_grid.summarize_scenarios(df)),
+        ('average_by_horizon', lambda: scenario_grid.average_by_horizon(df)),
+        ('format_currency_column', lambda: scenario_grid.format_currency_column(df[scenario_grid.DIFFERENCE])),
+        ('grid_rerun', rerun),
+    ]
+
+
+def run(horizons=HORIZONS, repeat=7, grid_rows=GRID_ROWS):
+    """Executa os micro-benchmarks e retorna {'<função>@<meses>m': estatísticas} e {'<caso>@<linhas>rows': estatísticas}."""
+    results = {
+        'format_currency': time_call(lambda: format_currency(1234567.891), repeat),
+        'calculate_progressive_tax': time_call(lambda: calculate_progressive_tax(12_500_000), repeat),
+    }
+    for months in horizons:
+        for name, func in horizon_cases(months):
+            results[f"{name}@{months}m"] = time_call(func, repeat)
+    if grid_rows:
+        for name, func in grid_cases(grid_rows):
+            results[f"{name}@{grid_rows}rows"] = time_call(func, repeat)
+    return results
@@ -0,0 +1,193 @@
+import logging
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from benchmarks.common import APP_DIR, peak_rss_mb, summarize
+
+PAGES = {
+    'home': APP_DIR / "Home.py",
+    'capital_proprio': next(APP_DIR.glob("pages/1_*.py")),
+    'consorcio': next(APP_DIR.glob("pages/2_*.py")),
+    'mix_financiamento': next(APP_DIR.glob("pages/3_*.py")),
+}
+
+# Roteiro de interações por página: (tipo do widget, rótulo, gerador do novo valor).
+# Botões são apenas clicados; páginas sem roteiro (Home) são apenas reexecutadas.
+SCRIPTS = {
+    'home': [],
+    'capital_proprio': [
+        ('number_input', "Qual o seu Investimento inicial?", lambda rng: rng.randrange(1_000_000, 5_000_001, 50_000)),
+        ('number_input', "Tempo de Construção (meses)", lambda rng: rng.randint(6, 60)),
+        ('slider', "Taxa de Rendimento Mensal (%)", lambda rng: round(rng.uniform(0.5, 3.0), 3)),
+        ('number_input', "Valor do m² de Venda (R$)", lambda rng: rng.randrange(8000, 14001, 100)),
+        ('slider', "Variação no Valor de Venda (%)", lambda rng: rng.randint(-20, 20)),
+        ('slider', "Variação no Custo da Obra (%)", lambda rng: rng.randint(-20, 20)),
+        ('button', "💾 Salvar Cenário Atual", None),
+    ],
+    'consorcio': [
+        ('number_input', "Valor liberado pelo Itaú (Consórcio)", lambda rng: rng.randrange(1_000_000, 4_000_001, 50_000)),
+        ('number_input', "Tempo de Construção (meses)", lambda rng: rng.randint(6, 60)),
+        ('number_input', "Juros anuais do consórcio (%)", lambda rng: round(rng.uniform(0.0, 25.0), 1)),
+        ('slider', "Taxa de Rendimento Mensal (%)", lambda rng: round(rng.uniform(0.5, 3.0), 3)),
+        ('slider', "Variação no Valor de Venda (%)", lambda rng: rng.randint(-20, 20)),
+        ('slider', "Variação no Custo da Obra (%)", lambda rng: rng.randint(-20, 20)),
+        ('button', "Salvar Resultado para Comparação 💾", None),
+    ],
+    'mix_financiamento': [
+        ('number_input', "Capital próprio disponível (0% consórcio)", lambda rng: rng.randrange(1_000_000, 5_000_001, 50_000)),
+        ('number_input', "Carta de consórcio (100% consórcio)", lambda rng: rng.randrange(1_000_000, 4_000_001, 50_000)),
+        ('number_input', "Tempo de Construção (meses)", lambda rng: rng.randint(6, 60)),
+        ('number_input', "Juros anuais do consórcio (%)", lambda rng: round(rng.uniform(0.0, 25.0), 1)),
+        ('slider', "Taxa de Rendimento Mensal (%)", lambda rng: round(rng.uniform(0.5, 3.0), 3)),
+        ('slider', "Variação no Valor de Venda (%)", lambda rng: rng.randint(-20, 20)),
+        ('slider', "Variação no Custo da Obra (%)", lambda rng: rng.randint(-20, 20)),
+    ],
+}
+
+
+def _find_widget(at, kind, label):
+    for widget in getattr(at, kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"Widget '{label}' ({kind}) não encontrado")
+
+
+def run_session(page, seed, steps, timeout):
+    """
+    Simula uma sessão: carrega a página e aplica `steps` interações do roteiro,
+    medindo a latência de cada rerun. Várias sessões rodam ao mesmo tempo, em threads.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    script = SCRIPTS[page]
+
+    at = AppTest.from_file(str(PAGES[page]), default_timeout=timeout)
+    start = time.perf_counter()
+    at.run()
+    initial_ms = (time.perf_counter() - start) * 1000
+
+    rerun_ms = []
+    errors = len(at.exception)
+    offset = rng.randrange(len(script)) if script else 0
+    for i in range(steps):
+        if script:
+            kind, label, new_value = script[(offset + i) % len(script)]
+            try:
+                widget = _find_widget(at, kind, label)
+            except LookupError:
+                # A execução anterior falhou antes de desenhar o widget: conta como erro e só reexecuta.
+                errors += 1
+            else:
+                if kind == 'button':
+                    widget.click()
+                else:
+                    widget.set_value(new_value(rng))
+        start = time.perf_counter()
+        at.run()
+        rerun_ms.append((time.perf_counter() - start) * 1000)
+        errors += len(at.exception)
+
+    return {'page': page, 'initial_ms': initial_ms, 'rerun_ms': rerun_ms, 'errors': errors}
+
+
+@contextmanager
+def _shared_runtime():
+    """
+    O AppTest instala um Runtime simulado no início de cada execução e o remove
+    ao final, o que derrubaria as outras sessões em andamento. Enquanto o contexto
+    estiver ativo, uma execução de script que encontrar o Runtime removido recebe
+    um Runtime comum a todas as sessões, e o bytecode das páginas é compilado uma
+    só vez, como em um servidor real (compilar em várias threads ao mesmo tempo
+    quebra o `ast.parse` do Python 3.11). O aviso de ScriptRunContext ausente,
+    emitido ao criar cada AppTest fora de uma execução de script, é silenciado.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1.util import patch_config_options
+
+    shared = MagicMock(spec=Runtime)
+    shared.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    shared.dataframe_source_mgr = DataframeSourceManager()
+    shared.cache_storage_manager = MemoryCacheStorageManager()
+    script_cache = ScriptCache()
+
+    def in_script_run():
+        return get_script_run_ctx(suppress_warning=True) is not None
+
+    def instance(cls):
+        if cls._instance is None and in_script_run():
+            return shared
+        return real_instance()
+
+    def exists(cls):
+        return cls._instance is not None or in_script_run()
+
+    def not_bare_mode_warning(record):
+        return "missing ScriptRunContext" not in record.getMessage()
+
+    real_instance = Runtime.instance
+    context_logger = logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context")
+    context_logger.addFilter(not_bare_mode_warning)
+    try:
+        with patch.object(Runtime, "instance", classmethod(instance)), \
+                patch.object(Runtime, "exists", classmethod(exists)), \
+                patch("streamlit.testing.v1.app_test.ScriptCache", lambda: script_cache), \
+                patch("streamlit.testing.v1.local_script_runner.ScriptCache", lambda: script_cache), \
+                patch_config_options({"global.appTest": True}):
+            yield
+    finally:
+        context_logger.removeFilter(not_bare_mode_warning)
+
+
+def run(sessions=50, concurrency=None, steps=10, pages=tuple(PAGES), timeout=60, seed=0):
+    """
+    Dispara `sessions` sessões simuladas por página, com até `concurrency`
+    sessões simultâneas em threads de um único processo (como um servidor
+    Streamlit), e agrega latência, memória e vazão por página.
+    Todas as sessões compartilham um cache de cenários novo, como um servidor recém-iniciado.
+    """
+    from scenario_cache import get_store
+
+    concurrency = concurrency or os.cpu_count()
+    previous_cache_dir = os.environ.get("SCENARIO_CACHE_DIR")
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir, _shared_runtime():
+            os.environ["SCENARIO_CACHE_DIR"] = cache_dir
+            get_store.clear()
+            report = {'sessions_per_page': sessions, 'concurrency': concurrency, 'steps': steps, 'pages': {}}
+            for page in pages:
+                rss_before = peak_rss_mb()
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    futures = [pool.submit(run_session, page, seed + i, steps, timeout) for i in range(sessions)]
+                    results = [f.result() for f in futures]
+                elapsed = time.perf_counter() - start
+
+                reruns = [ms for r in results for ms in r['rerun_ms']]
+                report['pages'][page] = {
+                    'initial_run': summarize([r['initial_ms'] for r in results]),
+                    'rerun': summarize(reruns),
+                    'peak_rss_mb': peak_rss_mb(),
+                    'rss_growth_mb': peak_rss_mb() - rss_before,
+                    'errors': sum(r['errors'] for r in results),
+                    'wall_time_s': elapsed,
+                    'throughput_reruns_per_s': (len(reruns) + len(results)) / elapsed,
+                }
+    finally:
+        if previous_cache_dir is None:
+            del os.environ["SCENARIO_CACHE_DIR"]
+        else:
+            os.environ["SCENARIO_CACHE_DIR"] = previous_cache_dir
+        get_store.clear()
+    return report
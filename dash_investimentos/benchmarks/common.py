@@ -0,0 +1,99 @@
+import json
+import platform
+import resource
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+APP_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# As páginas importam os módulos do app a partir do diretório do Home.py,
+# que o `streamlit run` coloca no sys.path.
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+
+def default_params(page, months):
+    """Parâmetros padrão de uma página (`scenarios.ScenarioPage`) para um dado horizonte."""
+    from scenario_cache import default_values
+
+    return page.build_params({**default_values(page.url_params), 'months': months})
+
+
+def summarize(samples_ms):
+    """Resume uma lista de latências (ms) em percentis."""
+    samples = np.asarray(samples_ms, dtype=float)
+    if samples.size == 0:
+        return {'count': 0}
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        'count': int(samples.size), 'mean_ms': float(samples.mean()),
+        'min_ms': float(samples.min()), 'p50_ms': float(p50),
+        'p95_ms': float(p95), 'p99_ms': float(p99), 'max_ms': float(samples.max())
+    }
+
+
+def peak_rss_mb():
+    """Pico de memória residente do processo atual, em MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta em KB; macOS, em bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def environment():
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(), 'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+
+def save_results(results, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def find_regressions(current, baseline, tolerance):
+    """
+    Compara dois relatórios e lista as métricas que pioraram além da tolerância
+    (ex.: 0.25 = 25% mais lentas, maiores ou com menos vazão). Só são comparadas
+    métricas presentes nos dois.
+    """
+    regressions = []
+
+    def check(name, new, old):
+        if old and new > old * (1 + tolerance):
+            regressions.append(f"{name}: {old:.3f} -> {new:.3f} (+{(new / old - 1) * 100:.0f}%)")
+
+    def check_drop(name, new, old):
+        if old and new < old * (1 - tolerance):
+            regressions.append(f"{name}: {old:.3f} -> {new:.3f} ({(new / old - 1) * 100:.0f}%)")
+
+    engine_new = current.get('engine', {})
+    for case, stats in baseline.get('engine', {}).items():
+        if case in engine_new:
+            check(f"engine/{case} p50_ms", engine_new[case]['p50_ms'], stats['p50_ms'])
+
+    startup_new = current.get('imports', {}).get('startup')
+    startup_old = baseline.get('imports', {}).get('startup')
+    if startup_new and startup_old:
+        check("imports/startup total_ms", startup_new['total_ms'], startup_old['total_ms'])
+        for module in set(startup_new['deferred_loaded_at_startup']) - set(startup_old['deferred_loaded_at_startup']):
+            regressions.append(f"imports/startup: {module} voltou a ser importado na inicialização")
+
+    sessions_new = current.get('sessions', {}).get('pages', {})
+    for page, stats in baseline.get('sessions', {}).get('pages', {}).items():
+        if page in sessions_new and stats['rerun'].get('count'):
+            new = sessions_new[page]
+            for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+                check(f"sessions/{page} rerun {metric}", new['rerun'][metric], stats['rerun'][metric])
+            check(f"sessions/{page} peak_rss_mb", new['peak_rss_mb'], stats['peak_rss_mb'])
+            check_drop(f"sessions/{page} throughput_reruns_per_s", new['throughput_reruns_per_s'], stats['throughput_reruns_per_s'])
+            if new['errors'] > stats['errors'] or new['errors']:
+                regressions.append(f"sessions/{page} errors: {stats['errors']} -> {new['errors']}")
+    return regressions
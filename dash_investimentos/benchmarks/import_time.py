@@ -0,0 +1,76 @@
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from benchmarks.common import APP_DIR
+
+# Módulos importados no topo dos scripts do app (Home.py e páginas).
+STARTUP_MODULES = ("streamlit", "calculations", "charts", "scenario_cache", "scenarios", "warmup")
+
+# Bibliotecas pesadas que só devem ser carregadas quando um gráfico é montado
+# ou um cálculo é executado de fato. (`plotly.graph_objects` fica de fora: o
+# próprio streamlit o importa, e o módulo carrega suas classes sob demanda.)
+DEFERRED_MODULES = ("pandas", "numpy", "plotly.express")
+
+
+def _importtime(code):
+    """Executa `code` em um interpretador novo com -X importtime e retorna [(módulo, self_us, cumulativo_us, nível)]."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def startup_report(modules=STARTUP_MODULES, repeat=5, top=15):
+    """
+    Mede a importação dos módulos de inicialização do app e indica quais
+    pacotes dominam esse tempo (soma do tempo próprio por pacote de topo).
+    """
+    code = "import sys\n" + "".join(f"import {m}\n" for m in modules) + \
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    totals = []
+    by_package_runs = []
+    for _ in range(repeat):
+        entries = _importtime(code)
+        totals.append(sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000)
+        by_package = defaultdict(int)
+        for name, self_us, _, _ in entries:
+            by_package[name.split(".")[0]] += self_us
+        by_package_runs.append(by_package)
+
+    packages = {name for run in by_package_runs for name in run}
+    median_by_package = {name: statistics.median(run.get(name, 0) for run in by_package_runs) / 1000 for name in packages}
+    dominant = sorted(median_by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    loaded = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True, check=True)
+    return {
+        'modules': list(modules),
+        'total_ms': statistics.median(totals),
+        'dominant_packages_ms': dict(dominant),
+        'deferred_loaded_at_startup': [m for m in loaded.stdout.strip().split(",") if m],
+    }
+
+
+def deferred_report(modules=DEFERRED_MODULES, repeat=5):
+    """Tempo de importação isolado (ms) de cada biblioteca carregada sob demanda."""
+    report = {}
+    for module in modules:
+        samples = []
+        for _ in range(repeat):
+            entries = _importtime(f"import {module}")
+            samples.append(next(c for name, _, c, depth in entries if name == module and depth == 0) / 1000)
+        report[module] = statistics.median(samples)
+    return report
+
+
+def run(repeat=5):
+    return {'startup': startup_report(repeat=repeat), 'deferred_ms': deferred_report(repeat=repeat)}
@@ -0,0 +1,290 @@
+# --- FUNÇÕES DE CÁLCULO ---
+# O pandas (e o numpy) são importados dentro das funções que montam históricos:
+# assim, `import calculations` continua leve para quem só precisa das fórmulas.
+
+def format_currency(value):
+    """Formata um valor numérico como moeda brasileira (R$)."""
+    return f"R$ {value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+def calculate_progressive_tax(profit):
+    """
+    Calcula o imposto sobre ganho de capital com base na tabela progressiva.
+    """
+    if profit <= 0:
+        return 0
+
+    tax = 0
+    # Faixa 1: Até 5 milhões
+    first_tier_profit = min(profit, 5_000_000)
+    tax += first_tier_profit * 0.15
+
+    # Faixa 2: De 5 a 10 milhões
+    if profit > 5_000_000:
+        second_tier_profit = min(profit, 10_000_000) - 5_000_000
+        tax += second_tier_profit * 0.175
+
+    # Faixa 3: De 10 a 30 milhões
+    if profit > 10_000_000:
+        third_tier_profit = min(profit, 30_000_000) - 10_000_000
+        tax += third_tier_profit * 0.20
+
+    # Faixa 4: Acima de 30 milhões
+    if profit > 30_000_000:
+        fourth_tier_profit = profit - 30_000_000
+        tax += fourth_tier_profit * 0.225
+        
+    return tax
+
+def calculate_scenario_1(initial_investment, monthly_rate, months):
+    """
+    Calcula o resultado do Cenário 1: Aplicação Financeira, incluindo o imposto de renda.
+    """
+    import pandas as pd
+
+    history = []
+    balance = initial_investment
+    
+    for month in range(months + 1):
+        history.append({'Mês': month, 'Saldo (R$)': balance})
+        if month < months:
+                balance *= (1 + monthly_rate)
+            
+    history_df = pd.DataFrame(history)
+    final_amount_gross = history_df.iloc[-1]['Saldo (R$)']
+    
+    profit = final_amount_gross - initial_investment
+    income_tax = profit * 0.15 if profit > 0 else 0
+    
+    final_amount_net = final_amount_gross - income_tax
+    
+    return final_amount_net, income_tax, history_df
+
+def calculate_scenario_2(params):
+    """
+    Calcula o resultado do Cenário 2: Investimento em Construção, usando um dicionário de parâmetros.
+    """
+    import pandas as pd
+
+    # === ETAPA 0: VERIFICAR E CALCULAR INVESTIMENTO EXCEDENTE ===
+    total_project_cost = params['land_cost'] + params['construction_cost_input']
+    surplus_investment = 0
+    final_surplus_value = 0 
+
+    if params['initial_investment'] > total_project_cost:
+        surplus_investment = params['initial_investment'] - total_project_cost
+        if params['months'] > 0:
+            final_surplus_value = surplus_investment * ((1 + params['monthly_rate']) ** params['months'])
+        else:
+            final_surplus_value = surplus_investment
+
+    # === ETAPA 1: APLICAR VARIAÇÕES DE SENSIBILIDADE ===
+    effective_sale_price = params['sale_price'] * (1 + params['sale_price_variation'] / 100)
+    
+    # === ETAPA 2: DEFINIR FUNDO DE INVESTIMENTO PARA A OBRA ===
+    construction_fund_from_investment = params['construction_cost_input']
+    
+    # === ETAPA 3: CALCULAR CUSTO EFETIVO DA OBRA ===
+    effective_construction_cost = params['construction_cost_input'] * (1 + params['construction_cost_variation'] / 100)
+
+    # === ETAPA 4: SIMULAR EVOLUÇÃO DO FUNDO DURANTE A CONSTRUÇÃO E CALCULAR IR MENSAL ===
+    final_investment_balance = 0
+    history_df = pd.DataFrame([{'Mês': m, 'Saldo do Fundo (R$)': 0} for m in range(params['months'] + 1)])
+    ir_from_fund_yields = 0 
+
+    if construction_fund_from_investment > 0 and params['months'] > 0:
+        monthly_withdrawal = effective_construction_cost / params['months']
+        history = []
+        balance = construction_fund_from_investment
+        
+        for month in range(params['months'] + 1):
+            history.append({'Mês': month, 'Saldo do Fundo (R$)': balance})
+            
+            if month < params['months']:
+                monthly_yield = balance * params['monthly_rate']
+                
+                ir_on_yield = monthly_yield * 0.15
+                ir_from_fund_yields += ir_on_yield
+                
+                balance += monthly_yield
+                balance -= monthly_withdrawal
+        
+        history_df = pd.DataFrame(history)
+        history_df['Saldo do Fundo (R$)'] = history_df['Saldo do Fundo (R$)'].clip(lower=0)
+        final_investment_balance = history_df.iloc[-1]['Saldo do Fundo (R$)']
+
+    # === ETAPA 5: CALCULAR IMPOSTO DE RENDA TOTAL DO CENÁRIO 2 ===
+    profit_surplus = final_surplus_value - surplus_investment
+    ir_surplus = profit_surplus * 0.15 if profit_surplus > 0 else 0
+    
+    total_income_tax_s2 = ir_from_fund_yields + ir_surplus
+
+    # === ETAPA 6: CALCULAR CUSTOS E LUCROS DO IMÓVEL ===
+    house_total_cost = params['land_cost'] + effective_construction_cost
+    house_sale_profit = effective_sale_price - house_total_cost
+    
+    # === ETAPA 7: CALCULAR IMPOSTO SOBRE GANHO DE CAPITAL DA VENDA ===
+    real_estate_tax_paid = 0
+    if params['apply_sale_tax']:
+        real_estate_tax_paid = calculate_progressive_tax(house_sale_profit)
+    
+    # === ETAPA 8: CALCULAR RESULTADO FINAL LÍQUIDO ===
+    final_total = (final_investment_balance + final_surplus_value + effective_sale_price) - (real_estate_tax_paid + total_income_tax_s2)
+    
+    # === ETAPA 9: CALCULAR ECONOMIA FISCAL DA EMPRESA ===
+    tax_saving = params['initial_investment'] * (params['corporate_tax_rate'] / 100)
+    
+    # === ETAPA 10: ORGANIZAR DETALHES FISCAIS PARA RETORNO ===
+    tax_details = {
+        "Custo Total do Imóvel": house_total_cost,
+        "Lucro da Venda": house_sale_profit,
+        "Imposto Pago (Ganho de Capital)": real_estate_tax_paid,
+        "Economia de Imposto (Empresa)": tax_saving
+    }
+    
+    return final_total, history_df, tax_details, effective_sale_price, final_surplus_value, total_income_tax_s2
+
+def calculate_progressive_tax_consortium(profit):
+    """
+    Imposto sobre ganho de capital usado pela página Consórcio. Para lucros acima
+    de 5 milhões, a primeira faixa (15%) não é aplicada.
+    """
+    if profit <= 0: return 0
+    tax = 0
+    if profit <= 5_000_000: tax += profit * 0.15
+    if profit > 5_000_000: tax += min(profit - 5_000_000, 5_000_000) * 0.175
+    if profit > 10_000_000: tax += min(profit - 10_000_000, 20_000_000) * 0.20
+    if profit > 30_000_000: tax += (profit - 30_000_000) * 0.225
+    return tax
+
+def calculate_consortium_operation(params):
+    """
+    Calcula o resultado da Operação com Consórcio: terreno com capital próprio e obra
+    financiada pela carta de consórcio, usando um dicionário de parâmetros.
+    """
+    import pandas as pd
+
+    effective_construction_cost = params['construction_cost_input'] * (1 + params['construction_cost_variation'] / 100)
+    effective_sale_price = params['sale_price'] * (1 + params['sale_price_variation'] / 100)
+    final_investment_balance = 0
+    ir_from_fund_yields = 0
+    history_s2 = []
+    if params['consortium_loan'] > 0 and params['months'] > 0:
+        monthly_withdrawal = effective_construction_cost / params['months']
+        balance = params['consortium_loan']
+        for month in range(params['months'] + 1):
+            history_s2.append({'Mês': month, 'Saldo do Fundo (R$)': balance})
+            if month < params['months']:
+                monthly_yield = balance * params['monthly_rate']
+                ir_on_yield = monthly_yield * 0.15
+                ir_from_fund_yields += ir_on_yield
+                balance += monthly_yield
+                balance -= monthly_withdrawal
+        final_investment_balance = balance if balance > 0 else 0
+    history_s2_df = pd.DataFrame(history_s2)
+    history_s2_df['Saldo do Fundo (R$)'] = history_s2_df['Saldo do Fundo (R$)'].clip(lower=0)
+    construction_years = params['months'] / 12.0
+    total_interest_paid = params['consortium_loan'] * (params['consortium_interest_rate'] / 100) * construction_years
+    total_loan_repayment = params['consortium_loan'] + total_interest_paid
+    house_total_cost = params['land_cost'] + effective_construction_cost
+    house_sale_profit = effective_sale_price - house_total_cost
+    real_estate_tax_paid = calculate_progressive_tax_consortium(house_sale_profit) if params['apply_sale_tax'] else 0
+    total_taxes = real_estate_tax_paid + ir_from_fund_yields
+    final_net_cash = (effective_sale_price + final_investment_balance) - (total_loan_repayment + total_taxes)
+    tax_saving = params['land_cost'] * (params['corporate_tax_rate'] / 100)
+    final_result_with_benefit = final_net_cash + tax_saving
+    details = {
+        "Custo Efetivo da Construção": effective_construction_cost,
+        "Valor Efetivo de Venda": effective_sale_price,
+        "Repagamento Total do Consórcio": total_loan_repayment,
+        "Juros do Consórcio": total_interest_paid,
+        "Imposto sobre Venda do Imóvel": real_estate_tax_paid,
+        "IR sobre Rendimento do Fundo": ir_from_fund_yields,
+        "Benefício Fiscal (sobre Terreno)": tax_saving,
+        "Saldo Final do Fundo de Investimento": final_investment_balance,
+        "Resultado Líquido da Operação": final_result_with_benefit
+    }
+    return final_result_with_benefit, details, history_s2_df
+
+def calculate_funding_mix(params, shares=None):
+    """
+    Calcula a operação de construção para várias participações do consórcio no
+    financiamento da obra (0 = 100% capital próprio, 1 = obra toda pelo consórcio),
+    em uma única passada vetorizada.
+
+    Para uma participação s, o capital próprio aplicado é (1 - s) * investimento
+    inicial + s * terreno, a carta utilizada é s * consórcio e o fundo da obra
+    começa com (1 - s) * construção + s * carta. O benefício fiscal incide sobre
+    o capital próprio aplicado. Nos extremos, o modelo coincide com
+    `calculate_scenario_2` (somado à economia de imposto) e com
+    `calculate_consortium_operation`.
+    """
+    import numpy as np
+    import pandas as pd
+
+    shares = np.linspace(0, 1, 101) if shares is None else np.asarray(shares, dtype=float)
+    months = params['months']
+    monthly_rate = params['monthly_rate']
+    growth = (1 + monthly_rate) ** months
+
+    # === CAPITAL PRÓPRIO, CARTA DE CONSÓRCIO E EXCEDENTE ===
+    own_capital = (1 - shares) * params['initial_investment'] + shares * params['land_cost']
+    loan = shares * params['consortium_loan']
+    surplus_investment = (1 - shares) * max(params['initial_investment'] - (params['land_cost'] + params['construction_cost_input']), 0)
+    final_surplus_value = surplus_investment * growth if months > 0 else surplus_investment
+    profit_surplus = final_surplus_value - surplus_investment
+    ir_surplus = np.where(profit_surplus > 0, profit_surplus * 0.15, 0)
+
+    # === VARIAÇÕES DE SENSIBILIDADE E IMPOSTO SOBRE A VENDA (iguais para todo o mix) ===
+    effective_sale_price = params['sale_price'] * (1 + params['sale_price_variation'] / 100)
+    effective_construction_cost = params['construction_cost_input'] * (1 + params['construction_cost_variation'] / 100)
+    house_sale_profit = effective_sale_price - (params['land_cost'] + effective_construction_cost)
+    # As páginas Capital Próprio e Consórcio calculam o imposto sobre a venda com
+    # tabelas diferentes acima de 5 milhões; o mix interpola entre as duas para
+    # coincidir com cada página no seu extremo.
+    real_estate_tax_paid = 0
+    if params['apply_sale_tax']:
+        real_estate_tax_paid = (1 - shares) * calculate_progressive_tax(house_sale_profit) \
+            + shares * calculate_progressive_tax_consortium(house_sale_profit)
+
+    # === FUNDO DA OBRA: MESMA EVOLUÇÃO MENSAL DOS DOIS CENÁRIOS, PARA TODAS AS PARTICIPAÇÕES ===
+    fund_start = (1 - shares) * params['construction_cost_input'] + shares * params['consortium_loan']
+    balance = fund_start.copy()
+    ir_from_fund_yields = np.zeros_like(shares)
+    if months > 0:
+        monthly_withdrawal = effective_construction_cost / months
+        for _ in range(months):
+            monthly_yield = balance * monthly_rate
+            ir_from_fund_yields += monthly_yield * 0.15
+            balance += monthly_yield
+            balance -= monthly_withdrawal
+    fund_active = (fund_start > 0) & (months > 0)
+    final_investment_balance = np.where(fund_active, np.clip(balance, 0, None), 0)
+    ir_from_fund_yields = np.where(fund_active, ir_from_fund_yields, 0)
+
+    # === CONSÓRCIO, BENEFÍCIO FISCAL E RESULTADO ===
+    total_interest_paid = loan * (params['consortium_interest_rate'] / 100) * (months / 12.0)
+    total_loan_repayment = loan + total_interest_paid
+    tax_saving = own_capital * (params['corporate_tax_rate'] / 100)
+    final_result = (effective_sale_price + final_investment_balance + final_surplus_value) \
+        - (total_loan_repayment + real_estate_tax_paid + ir_from_fund_yields + ir_surplus) + tax_saving
+
+    # TIR do capital próprio: aplicado no mês 0, resultado líquido recebido no fim da obra.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        monthly_irr = np.where(
+            (own_capital > 0) & (final_result > 0) & (months > 0),
+            (final_result / own_capital) ** (1 / max(months, 1)) - 1, np.nan
+        )
+
+    return pd.DataFrame({
+        'Participação do Consórcio (%)': shares * 100,
+        'Capital Próprio (R$)': own_capital,
+        'Carta de Consórcio (R$)': loan,
+        'Juros do Consórcio (R$)': total_interest_paid,
+        'Saldo Final do Fundo (R$)': final_investment_balance,
+        'Imposto de Renda (R$)': ir_from_fund_yields + ir_surplus,
+        'Imposto sobre Venda (R$)': real_estate_tax_paid + np.zeros_like(shares),
+        'Benefício Fiscal (R$)': tax_saving,
+        'Resultado Líquido (R$)': final_result,
+        'Lucro Líquido (R$)': final_result - own_capital,
+        'TIR Anual (%)': ((1 + monthly_irr) ** 12 - 1) * 100,
+    })
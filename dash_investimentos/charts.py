@@ -0,0 +1,144 @@
+from calculations import format_currency
+
+# O plotly (e o pandas) são carregados apenas quando um gráfico é montado,
+# para não pesar na inicialização das páginas que servem gráficos do cache.
+
+# --- GRÁFICOS: CAPITAL PRÓPRIO ---
+
+def build_growth_figure(history_s1, months):
+    """Gráfico de crescimento bruto da aplicação financeira, com marcos do período."""
+    import plotly.graph_objects as go
+
+    fig_rf = go.Figure()
+    fig_rf.add_trace(go.Scatter(x=history_s1['Mês'], y=history_s1['Saldo (R$)'], mode='lines', name='Saldo', fill='tozeroy', line=dict(color='#1f77b4', width=4), fillcolor='rgba(31, 119, 180, 0.3)', hovertemplate='<b>Mês %{x}</b><br>Saldo: R$ %{y:,.2f}<extra></extra>'))
+    marco_meses = sorted(list(set([0, months//4, months//2, 3*months//4, months])))
+    marco_valores = [history_s1.iloc[m]['Saldo (R$)'] for m in marco_meses]
+    fig_rf.add_trace(go.Scatter(x=marco_meses, y=marco_valores, mode='markers', marker=dict(size=10, color='#ff7f0e', symbol='circle'), name='Marcos', hovertemplate='<b>Mês %{x}</b><br>Saldo: R$ %{y:,.2f}<extra></extra>'))
+    fig_rf.update_layout(title='<b>Crescimento do Investimento (Bruto)</b>', xaxis_title='Período (Meses)', yaxis_title='Valor Acumulado (R$)', height=450, showlegend=False, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', font=dict(size=12), title_font=dict(size=16, color='#2c3e50'), xaxis=dict(gridcolor='rgba(128,128,128,0.2)'), yaxis=dict(gridcolor='rgba(128,128,128,0.2)', tickformat='$,.0f'))
+    return fig_rf
+
+def build_evolution_figure(history_s1, s2_timeline):
+    """Gráfico comparativo do crescimento bruto: aplicação vs. construção."""
+    import plotly.graph_objects as go
+
+    fig_comp_evolucao = go.Figure()
+    fig_comp_evolucao.add_trace(go.Scatter(
+        x=history_s1['Mês'], y=history_s1['Saldo (R$)'], mode='lines', name='Aplicação Financeira (Bruto)',
+        line=dict(color='royalblue', width=4), hovertemplate='Mês %{x}:<br>R$ %{y:,.2f}<extra></extra>'
+    ))
+    fig_comp_evolucao.add_trace(go.Scatter(
+        x=s2_timeline['Mês'], y=s2_timeline['Evolução Construção (R$)'], mode='lines', name='Construção (Bruto)',
+        line=dict(color='darkorange', width=4, dash='dash'), hovertemplate='Mês %{x}:<br>R$ %{y:,.2f}<extra></extra>'
+    ))
+    fig_comp_evolucao.update_layout(
+        height=500, title='<b>Crescimento Bruto do Capital: Aplicação vs. Construção</b>',
+        xaxis_title='Período (Meses)', yaxis_title='Valor Total (R$)',
+        showlegend=True, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12, color='#333'), title_font=dict(size=18, color='#2c3e50'),
+        xaxis=dict(gridcolor='rgba(128,128,128,0.2)'), yaxis=dict(gridcolor='rgba(128,128,128,0.2)', tickformat='$,.0f'),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig_comp_evolucao
+
+def build_tax_benefit_figure(economia, investimento_liquido):
+    """Gráfico de rosca com a proporção do benefício fiscal sobre o investimento."""
+    import plotly.graph_objects as go
+
+    fig_fiscal = go.Figure(data=[go.Pie(
+        labels=['Economia Fiscal Gerada', 'Custo Efetivo do Investimento'],
+        values=[economia, investimento_liquido],
+        hole=.4,
+        marker_colors=['#27ae60', '#34495e'],
+        textinfo='percent+label',
+        insidetextorientation='radial'
+    )])
+
+    fig_fiscal.update_layout(
+        title_text="<b>Proporção do Benefício Fiscal sobre o Investimento</b>",
+        height=350,
+        margin=dict(l=20, r=20, t=60, b=20),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5)
+    )
+    return fig_fiscal
+
+def build_final_comparison_figure(final_s1, final_s2_total_benefit):
+    """Gráfico de barras com os valores finais de cada cenário."""
+    import plotly.graph_objects as go
+
+    fig_comp_bar = go.Figure(data=[
+        go.Bar(name='Aplicação', x=['Resultado Final'], y=[final_s1], text=format_currency(final_s1), textposition='auto', marker_color='royalblue'),
+        go.Bar(name='Construção (Total)', x=['Resultado Final'], y=[final_s2_total_benefit], text=format_currency(final_s2_total_benefit), textposition='auto', marker_color='darkorange')
+    ])
+    fig_comp_bar.update_layout(barmode='group', title='Comparativo dos Valores Finais', yaxis_title='Valor Total (R$)', height=300, margin=dict(l=20, r=20, t=40, b=20))
+    return fig_comp_bar
+
+# --- GRÁFICOS: CONSÓRCIO ---
+
+def build_land_growth_figure(history_s1):
+    """Gráfico de crescimento bruto do valor do terreno aplicado em renda fixa."""
+    import plotly.graph_objects as go
+
+    fig_rf = go.Figure(data=[go.Scatter(x=history_s1['Mês'], y=history_s1['Saldo (R$)'], mode='lines', name='Saldo', fill='tozeroy', line=dict(color='#1f77b4', width=4), fillcolor='rgba(31, 119, 180, 0.3)', hovertemplate='<b>Mês %{x}</b><br>Saldo: R$ %{y:,.2f}<extra></extra>')])
+    fig_rf.update_layout(height=350, showlegend=False, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    return fig_rf
+
+def build_cash_flow_figure(history_s1, history_s2_df, details, months):
+    """Fluxo de caixa da operação com consórcio, incluindo a quitação após a venda."""
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    s2_timeline = history_s2_df.copy().rename(columns={'Saldo do Fundo (R$)': 'Valor'})
+    pico_valor = details["Saldo Final do Fundo de Investimento"] + details["Valor Efetivo de Venda"]
+    s2_timeline.loc[s2_timeline['Mês'] == months, 'Valor'] = pico_valor
+    queda_valor = pico_valor - details["Repagamento Total do Consórcio"]
+    linha_queda = pd.DataFrame([{'Mês': months + 1, 'Valor': queda_valor}])
+    s2_timeline = pd.concat([s2_timeline, linha_queda], ignore_index=True)
+    history_s1_ext = pd.concat([
+        history_s1,
+        pd.DataFrame([{'Mês': months + 1, 'Saldo (R$)': history_s1.iloc[-1]['Saldo (R$)']}])
+    ], ignore_index=True)
+    fig_comp_evolucao = go.Figure()
+    fig_comp_evolucao.add_trace(go.Scatter(x=history_s1_ext['Mês'], y=history_s1_ext['Saldo (R$)'], mode='lines', name='Aplicação (Valor do Terreno)', line=dict(color='royalblue', width=4), hovertemplate='Mês %{x}:<br>R$ %{y:,.2f}<extra></extra>'))
+    fig_comp_evolucao.add_trace(go.Scatter(x=s2_timeline['Mês'], y=s2_timeline['Valor'], mode='lines', name='Operação Consórcio (Fluxo de Caixa)', line=dict(color='darkorange', width=4, dash='dash'), hovertemplate='Mês %{x}:<br>R$ %{y:,.2f}<extra></extra>'))
+    fig_comp_evolucao.update_layout(height=400, title_text='<b>Evolução do Fundo do Consórcio vs. Aplicação do Capital Próprio</b>', showlegend=True, legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+    return fig_comp_evolucao
+
+def build_profit_comparison_figure(lucro_s1, lucro_s2):
+    """Gráfico de barras com o lucro de cada alternativa."""
+    import plotly.graph_objects as go
+
+    fig_comp_bar = go.Figure(data=[go.Bar(name='Lucro Aplicação', x=['Lucro Final'], y=[lucro_s1], text=format_currency(lucro_s1), textposition='auto', marker_color='royalblue'), go.Bar(name='Lucro Consórcio', x=['Lucro Final'], y=[lucro_s2], text=format_currency(lucro_s2), textposition='auto', marker_color='darkorange')])
+    fig_comp_bar.update_layout(barmode='group', title='Comparativo dos Lucros Finais', yaxis_title='Lucro Total (R$)', height=400, margin=dict(l=20, r=20, t=40, b=20))
+    return fig_comp_bar
+
+# --- GRÁFICOS: MIX DE FINANCIAMENTO ---
+
+def build_funding_mix_figure(mix_df, fixed_income_irr, best_irr, best_profit):
+    """
+    Resultado líquido, lucro e TIR anual em função da participação do consórcio na obra.
+    `best_irr` e `best_profit` são as linhas de `mix_df` com maior TIR e maior lucro (None se nenhuma).
+    """
+    import plotly.graph_objects as go
+
+    share = mix_df['Participação do Consórcio (%)']
+    fig_mix = go.Figure()
+    fig_mix.add_trace(go.Scatter(x=share, y=mix_df['Resultado Líquido (R$)'], mode='lines', name='Resultado Líquido', line=dict(color='darkorange', width=4), hovertemplate='%{x:.0f}% consórcio:<br>R$ %{y:,.2f}<extra></extra>'))
+    fig_mix.add_trace(go.Scatter(x=share, y=mix_df['Lucro Líquido (R$)'], mode='lines', name='Lucro Líquido', line=dict(color='#27ae60', width=3), hovertemplate='%{x:.0f}% consórcio:<br>R$ %{y:,.2f}<extra></extra>'))
+    fig_mix.add_trace(go.Scatter(x=share, y=mix_df['TIR Anual (%)'], mode='lines', name='TIR Anual', yaxis='y2', line=dict(color='royalblue', width=4, dash='dash'), hovertemplate='%{x:.0f}% consórcio:<br>TIR %{y:.2f}% a.a.<extra></extra>'))
+
+    if best_profit is not None:
+        fig_mix.add_trace(go.Scatter(x=[share[best_profit]], y=[mix_df['Lucro Líquido (R$)'][best_profit]], mode='markers', name='Maior Lucro', marker=dict(size=14, color='#27ae60', symbol='star'), hovertemplate='Maior lucro: %{x:.0f}% consórcio<br>R$ %{y:,.2f}<extra></extra>'))
+    if best_irr is not None:
+        fig_mix.add_trace(go.Scatter(x=[share[best_irr]], y=[mix_df['TIR Anual (%)'][best_irr]], mode='markers', name='Maior TIR', yaxis='y2', marker=dict(size=14, color='royalblue', symbol='star'), hovertemplate='Maior TIR: %{x:.0f}% consórcio<br>%{y:.2f}% a.a.<extra></extra>'))
+    fig_mix.add_hline(y=fixed_income_irr, yref='y2', line=dict(color='gray', dash='dot'), annotation_text=f'Renda fixa: {fixed_income_irr:.2f}% a.a.', annotation_position='bottom right')
+
+    fig_mix.update_layout(
+        height=500, title='<b>Resultado e TIR por Participação do Consórcio na Obra</b>',
+        xaxis=dict(title='Parcela da Construção Financiada pelo Consórcio (%)', ticksuffix='%', gridcolor='rgba(128,128,128,0.2)'),
+        yaxis=dict(title='Valor (R$)', tickformat='$,.0f', gridcolor='rgba(128,128,128,0.2)'),
+        yaxis2=dict(title='TIR Anual (%)', overlaying='y', side='right', ticksuffix='%', showgrid=False),
+        showlegend=True, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12, color='#333'), title_font=dict(size=18, color='#2c3e50'),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig_mix
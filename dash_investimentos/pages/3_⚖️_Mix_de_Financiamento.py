@@ -0,0 +1,114 @@
+import math
+
+import streamlit as st
+
+from calculations import format_currency
+from scenario_cache import get_store, initial_params, publish_params, scenario_key
+from scenarios import MIX_FINANCIAMENTO, page_url_values, project_costs
+
+# --- CONFIGURAÇÃO DA PÁGINA ---
+st.set_page_config(
+    page_title="Mix de Financiamento | Simulador",
+    page_icon="⚖️",
+    layout="wide"
+)
+
+# --- PARÂMETROS COMPARTILHÁVEIS (URL) ---
+url_defaults = initial_params(MIX_FINANCIAMENTO.page_id, MIX_FINANCIAMENTO.url_params)
+# Valores dos widgets, indexados pelo nome do parâmetro (ver `scenarios.py`).
+inputs = {}
+
+# --- INTERFACE DA APLICAÇÃO ---
+st.title("⚖️ Mix de Financiamento: Capital Próprio vs. Consórcio")
+st.markdown("Compare todas as combinações entre construir só com capital próprio e financiar a obra inteira pelo consórcio: o terreno é sempre pago com capital próprio, e a parcela da construção financiada pelo consórcio varia de 0% a 100%.")
+st.markdown("---")
+
+# --- BARRA LATERAL ---
+with st.sidebar:
+    inputs['initial_investment'] = st.number_input("Capital próprio disponível (0% consórcio)", min_value=10000, max_value=1_000_000_000, value=url_defaults['initial_investment'], step=50000, help="Investimento inicial usado quando toda a obra é paga com capital próprio, como na página Capital Próprio.")
+    st.caption(f"Valor: {format_currency(inputs['initial_investment'])}")
+    inputs['consortium_loan'] = st.number_input("Carta de consórcio (100% consórcio)", min_value=10000, max_value=1_000_000_000, value=url_defaults['consortium_loan'], step=50000, help="Valor liberado pelo consórcio quando toda a obra é financiada, como na página Consórcio.")
+    st.caption(f"Valor: {format_currency(inputs['consortium_loan'])}")
+    st.markdown("---")
+    with st.expander("Parâmetros da Construção", expanded=True):
+        inputs['use_m2_pricing'] = st.checkbox("Calcular custos por m²?", value=url_defaults['use_m2_pricing'])
+        if inputs['use_m2_pricing']:
+            inputs['land_area_m2'] = st.number_input("Área do Terreno (m²)", min_value=1.0, max_value=1_000_000.0, value=url_defaults['land_area_m2'], step=10.0)
+            inputs['construction_area_m2'] = st.number_input("Área de Construção (m²)", min_value=1.0, max_value=1_000_000.0, value=url_defaults['construction_area_m2'], step=10.0)
+            st.markdown("---")
+            inputs['land_cost_per_m2'] = st.number_input("Valor do m² do Terreno (R$)", min_value=0, max_value=1_000_000, value=url_defaults['land_cost_per_m2'], step=50)
+            inputs['construction_cost_per_m2'] = st.number_input("Valor do m² da Construção (R$)", min_value=0, max_value=1_000_000, value=url_defaults['construction_cost_per_m2'], step=100)
+            inputs['sale_price_per_m2'] = st.number_input("Valor do m² de Venda (R$)", min_value=0, max_value=1_000_000, value=url_defaults['sale_price_per_m2'], step=100)
+        else:
+            inputs['land_cost'] = st.number_input("Custo do Terreno (R$)", min_value=0, max_value=1_000_000_000, value=url_defaults['land_cost'], step=10000)
+            inputs['construction_cost'] = st.number_input("Custo da Construção (R$)", min_value=0, max_value=1_000_000_000, value=url_defaults['construction_cost'], step=10000)
+            inputs['sale_price'] = st.number_input("Valor de Venda da Casa (R$)", min_value=10000, max_value=1_000_000_000, value=url_defaults['sale_price'], step=50000)
+        land_cost_input, construction_cost_input, sale_price_input = project_costs(inputs)
+        st.info(f"Terreno: {format_currency(land_cost_input)} | Construção: {format_currency(construction_cost_input)}")
+        st.markdown("---")
+        inputs['months'] = st.number_input("Tempo de Construção (meses)", min_value=1, max_value=600, value=url_defaults['months'], step=1)
+        inputs['apply_sale_tax'] = st.checkbox("Deduzir imposto sobre ganho de capital da venda?", value=url_defaults['apply_sale_tax'])
+    with st.expander("Parâmetros Fiscais e da Aplicação", expanded=True):
+        inputs['consortium_interest_rate'] = st.number_input("Juros anuais do consórcio (%)", min_value=0.0, max_value=25.0, value=url_defaults['consortium_interest_rate'], step=0.1, format="%.1f", help="Taxa de juros anual a ser paga sobre o valor do consórcio.")
+        inputs['corporate_tax_rate'] = st.number_input("Imposto sobre Lucro da Empresa (%)", min_value=0.0, max_value=100.0, value=url_defaults['corporate_tax_rate'], step=0.5, format="%.1f")
+        inputs['monthly_rate'] = st.slider("Taxa de Rendimento Mensal (%)", min_value=0.5, max_value=3.0, value=url_defaults['monthly_rate'], step=0.001, format="%.3f%%")
+        MONTHLY_RATE = inputs['monthly_rate'] / 100
+        annual_rate = ((1 + MONTHLY_RATE)**12 - 1) * 100
+        st.info(f"**Taxa Anual Equivalente:** {annual_rate:.2f}%")
+        with st.expander("🔬 Extras (Análise de Sensibilidade)"):
+            inputs['sale_price_variation'] = st.slider("Variação no Valor de Venda (%)", -20, 20, url_defaults['sale_price_variation'])
+            inputs['construction_cost_variation'] = st.slider("Variação no Custo da Obra (%)", -20, 20, url_defaults['construction_cost_variation'])
+    st.caption("🔗 O endereço desta página guarda todos os parâmetros: copie-o para compartilhar ou reabrir este cenário.")
+
+# --- PUBLICAÇÃO DOS PARÂMETROS NA URL ---
+url_values = page_url_values(MIX_FINANCIAMENTO, inputs)
+publish_params(url_values)
+
+# --- EXECUÇÃO DOS CÁLCULOS ---
+params_mix = MIX_FINANCIAMENTO.build_params(url_values)
+resultado = get_store().get_or_compute(scenario_key(MIX_FINANCIAMENTO.page_id, params_mix), lambda: MIX_FINANCIAMENTO.simulate(params_mix))
+mix, best_irr, best_profit = resultado['mix'], resultado['best_irr'], resultado['best_profit']
+fixed_income_irr = resultado['fixed_income_irr']
+figures = resultado['figures']
+
+# --- LAYOUT PRINCIPAL ---
+st.header("🏆 Melhor Estrutura de Financiamento")
+cols_best = st.columns(3)
+with cols_best[0]:
+    if best_irr is not None:
+        st.metric("📈 Maior TIR", f"{best_irr['TIR Anual (%)']:.2f}% a.a.", delta=f"{best_irr['TIR Anual (%)'] - fixed_income_irr:.2f} p.p. sobre a renda fixa")
+        st.caption(f"Com **{best_irr['Participação do Consórcio (%)']:.0f}%** da obra pelo consórcio e {format_currency(best_irr['Capital Próprio (R$)'])} de capital próprio.")
+    else:
+        st.metric("📈 Maior TIR", "—")
+        st.caption("Nenhuma combinação tem resultado líquido positivo.")
+with cols_best[1]:
+    if best_profit is not None:
+        st.metric("💰 Maior Lucro Líquido", format_currency(best_profit['Lucro Líquido (R$)']))
+        st.caption(f"Com **{best_profit['Participação do Consórcio (%)']:.0f}%** da obra pelo consórcio e {format_currency(best_profit['Capital Próprio (R$)'])} de capital próprio.")
+    else:
+        st.metric("💰 Maior Lucro Líquido", "—")
+        st.caption("Não foi possível calcular o lucro com os parâmetros informados.")
+with cols_best[2]:
+    st.metric("🏦 TIR da Renda Fixa (Líquida)", f"{fixed_income_irr:.2f}% a.a.")
+    st.caption("Referência: o capital próprio aplicado na taxa mensal informada, com 15% de IR sobre o rendimento.")
+
+st.plotly_chart(figures['mix'], use_container_width=True)
+st.markdown(
+    "Nos extremos, o modelo reproduz as outras páginas: **0%** é a página *Capital Próprio* (benefício fiscal sobre todo o investimento) "
+    "e **100%** é a página *Consórcio* (benefício fiscal apenas sobre o terreno). Entre eles, o benefício fiscal incide sobre o capital próprio aplicado, "
+    "e a carta, os juros e o fundo da obra crescem na proporção financiada pelo consórcio."
+)
+
+st.markdown("---")
+st.header("📋 Detalhamento por Participação do Consórcio")
+# Tabela em Markdown a partir das listas do resultado: evita carregar o pandas quando o cenário vem do cache.
+step_rows = [i for i, share in enumerate(mix['Participação do Consórcio (%)']) if round(share) % 10 == 0]
+currency_columns = [column for column in mix if column.endswith("(R$)")]
+header = ["Consórcio na Obra", *currency_columns, "TIR Anual"]
+table_lines = ["| " + " | ".join(header) + " |", "|" + "---:|" * len(header)]
+for i in step_rows:
+    irr = mix['TIR Anual (%)'][i]
+    cells = [f"{mix['Participação do Consórcio (%)'][i]:.0f}%", *(format_currency(mix[column][i]) for column in currency_columns), "—" if math.isnan(irr) else f"{irr:.2f}%"]
+    table_lines.append("| " + " | ".join(cells) + " |")
+# "$" escapado: no Markdown do Streamlit, texto entre dois "$" vira fórmula LaTeX.
+st.markdown("\n".join(table_lines).replace("$", "\\$"))
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import math
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit as st
+
+# --- CONFIGURAÇÃO DO CACHE ---
+
+# Incrementar sempre que as funções de cálculo, os gráficos ou o formato dos
+# resultados mudarem, para que entradas antigas gravadas em disco deixem de ser servidas.
+CACHE_VERSION = 7
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".scenario_cache"
+DEFAULT_MAX_MB = 256
+
+# Ao ultrapassar o limite, remove entradas até sobrar esta fração dele, para que
+# a varredura do diretório não se repita a cada nova entrada.
+EVICTION_LOW_WATER = 0.9
+# Arquivos temporários mais antigos que isso são sobras de gravações interrompidas.
+STALE_TMP_SECONDS = 3600
+
+UrlParam = namedtuple("UrlParam", ["default", "min_value", "max_value"], defaults=(None, None))
+
+# Maior inteiro que os widgets numéricos do Streamlit aceitam (Number.MAX_SAFE_INTEGER do JavaScript).
+_MAX_WIDGET_INT = 2 ** 53 - 1
+
+
+# --- PARÂMETROS NA URL ---
+
+def _decode_value(raw, spec):
+    """
+    Converte o texto da URL para o tipo do valor padrão, respeitando os limites do widget.
+    Valores inválidos, não finitos (nan, inf) ou fora dos limites voltam ao padrão.
+    """
+    default = spec.default
+    try:
+        if isinstance(default, bool):
+            return raw.lower() in ("1", "true", "sim")
+        value = float(raw)
+    except (TypeError, ValueError):
+        return default
+    if not math.isfinite(value):
+        return default
+    if isinstance(default, int):
+        if abs(value) > _MAX_WIDGET_INT:
+            return default
+        value = int(value)
+
+    if spec.min_value is not None and value < spec.min_value:
+        return default
+    if spec.max_value is not None and value > spec.max_value:
+        return default
+    return value
+
+
+def _encode_value(value):
+    """Converte um valor de widget para o texto gravado na URL."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return repr(value)
+
+
+def default_values(spec):
+    """Valores padrão de todos os parâmetros de uma página."""
+    return {name: param.default for name, param in spec.items()}
+
+
+def initial_params(page, spec):
+    """
+    Retorna os valores iniciais dos widgets da página.
+
+    Na primeira execução da sessão, os parâmetros presentes na URL substituem os
+    valores padrão; o resultado é guardado na sessão para que os widgets mantenham
+    a mesma identidade nas execuções seguintes.
+    """
+    state_key = f"_url_params_{page}"
+    if state_key not in st.session_state:
+        values = {}
+        for name, param in spec.items():
+            raw = st.query_params.get(name)
+            values[name] = param.default if raw is None else _decode_value(raw, param)
+        st.session_state[state_key] = values
+    return st.session_state[state_key]
+
+
+def publish_params(values):
+    """Grava os valores atuais dos widgets na URL, tornando o cenário compartilhável."""
+    st.query_params.from_dict({name: _encode_value(value) for name, value in values.items()})
+
+
+def scenario_key(page, params):
+    """Gera a chave canônica (SHA-256) de um conjunto de parâmetros de cálculo."""
+    payload = json.dumps(
+        {"page": page, "version": CACHE_VERSION, "params": params},
+        sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# --- CACHE EM DISCO ---
+
+class ScenarioStore:
+    """
+    Cache em disco endereçado por conteúdo.
+
+    Cada entrada é gravada em `<diretório>/<2 primeiros caracteres>/<chave>.pkl`.
+    O tamanho total é acompanhado em memória; o diretório só é varrido na
+    primeira gravação e quando o total ultrapassa `max_bytes`. Nesse caso, as
+    entradas acessadas há mais tempo são removidas primeiro.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._total_bytes = None
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def get(self, key):
+        """Retorna o resultado gravado para a chave, ou None se não existir."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # Entrada corrompida ou gravada por outra versão: descarta.
+            path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def put(self, key, value):
+        """Grava o resultado de forma atômica e aplica o limite de tamanho."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                size = f.tell()
+            try:
+                replaced_size = path.stat().st_size
+            except FileNotFoundError:
+                replaced_size = 0
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_bytes += size - replaced_size
+            if self._total_bytes > self.max_bytes:
+                self._total_bytes = self._evict(int(self.max_bytes * EVICTION_LOW_WATER))
+
+    def _scan(self):
+        """Varre o diretório: remove temporários abandonados e retorna as entradas [(mtime, tamanho, caminho)]."""
+        stale_before = time.time() - STALE_TMP_SECONDS
+        for tmp_path in self.directory.glob("*/*.tmp"):
+            try:
+                if tmp_path.stat().st_mtime < stale_before:
+                    tmp_path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+        entries = []
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self, target_bytes):
+        """Remove as entradas acessadas há mais tempo até o total caber em `target_bytes`. Retorna o novo total."""
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= target_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        return total
+
+    def get_or_compute(self, key, compute):
+        """Retorna o resultado em cache ou executa `compute()` e grava o resultado."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+
+def store_from_env():
+    """Cria o cache a partir de SCENARIO_CACHE_DIR e SCENARIO_CACHE_MAX_MB."""
+    directory = os.environ.get("SCENARIO_CACHE_DIR", DEFAULT_CACHE_DIR)
+    max_mb = float(os.environ.get("SCENARIO_CACHE_MAX_MB", DEFAULT_MAX_MB))
+    return ScenarioStore(directory, int(max_mb * 1024 * 1024))
+
+
+@st.cache_resource
+def get_store():
+    """Instância do cache compartilhada por todas as sessões do servidor."""
+    return store_from_env()
@@ -0,0 +1,203 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from calculations import format_currency
+
+# --- COLUNAS DOS CENÁRIOS SALVOS ---
+INVESTMENT = "Investimento (R$)"
+FIXED_INCOME = "Resultado Renda Fixa (R$)"
+CONSTRUCTION = "Resultado Construção (R$)"
+DIFFERENCE = "Diferença (R$)"
+MONTHS = "Tempo (Meses)"
+SALE_VARIATION = "Var. Venda (%)"
+COST_VARIATION = "Var. Custo (%)"
+
+CURRENCY_COLUMNS = (INVESTMENT, FIXED_INCOME, CONSTRUCTION, DIFFERENCE)
+SORTABLE_COLUMNS = (DIFFERENCE, CONSTRUCTION, FIXED_INCOME, INVESTMENT, MONTHS, SALE_VARIATION, COST_VARIATION)
+SCENARIO_ID = "Nº"
+PAGE_SIZES = (25, 50, 100)
+
+_FRAME_STATE_KEY = "_scenario_grid_frame"
+
+
+# --- OPERAÇÕES NO SERVIDOR ---
+
+def scenarios_frame(scenarios, state):
+    """
+    Converte a lista de cenários salvos em DataFrame.
+    A conversão fica guardada em `state`; nas execuções seguintes, apenas os
+    cenários adicionados desde a última vez são convertidos.
+    """
+    cached = state.get(_FRAME_STATE_KEY)
+    if cached is not None and cached[0] is scenarios and cached[1] <= len(scenarios):
+        _, count, frame = cached
+        if count < len(scenarios):
+            new_rows = pd.DataFrame(scenarios[count:], index=pd.RangeIndex(count, len(scenarios)))
+            frame = pd.concat([frame, new_rows])
+    else:
+        frame = pd.DataFrame(scenarios)
+    state[_FRAME_STATE_KEY] = (scenarios, len(scenarios), frame)
+    return frame
+
+
+def filter_scenarios(df, months=None, min_difference=None):
+    """Filtra por prazo (lista de meses) e diferença mínima, com máscaras vetorizadas."""
+    mask = np.ones(len(df), dtype=bool)
+    if months:
+        mask &= df[MONTHS].isin(months).to_numpy()
+    if min_difference is not None:
+        mask &= df[DIFFERENCE].to_numpy() >= min_difference
+    return df[mask]
+
+
+def page_of(df, sort_by=DIFFERENCE, ascending=False, page=1, page_size=50):
+    """Ordena os cenários e retorna somente as linhas da página pedida, com seu número de cadastro."""
+    values = df[sort_by].to_numpy()
+    order = np.argsort(values if ascending else -values, kind="stable")
+    rows = order[(page - 1) * page_size:page * page_size]
+    page_df = df.iloc[rows]
+    return page_df.assign(**{SCENARIO_ID: page_df.index + 1})[[SCENARIO_ID, *df.columns]]
+
+
+def summarize_scenarios(df):
+    """Melhor e pior diferença e participação dos cenários em que a construção venceu."""
+    difference = df[DIFFERENCE].to_numpy()
+    best, worst = difference.argmax(), difference.argmin()
+    return {
+        'count': len(df),
+        'best': df.iloc[best], 'best_id': int(df.index[best]) + 1,
+        'worst': df.iloc[worst], 'worst_id': int(df.index[worst]) + 1,
+        'construction_wins': float((difference > 0).mean()),
+    }
+
+
+def average_by_horizon(df):
+    """Médias dos resultados por prazo de construção."""
+    grouped = df.groupby(MONTHS, sort=True)
+    averages = grouped[[FIXED_INCOME, CONSTRUCTION, DIFFERENCE]].mean()
+    averages.insert(0, "Cenários", grouped.size())
+    return averages.reset_index()
+
+
+# --- FORMATAÇÃO ---
+
+def _round_cents(amounts):
+    """
+    Arredonda valores não negativos para centavos exatamente como a formatação
+    do Python (`f"{x:.2f}"`): pelo valor binário exato, com empate para o par.
+    Um simples `np.rint(x * 100)` erra quando o produto é arredondado para o
+    meio-centavo (8082.315 vira 8.082,32 em vez de 8.082,31).
+    """
+    scaled = amounts * 100
+    # Erro exato do produto (Dekker): `scaled + error` é exatamente `amounts * 100`.
+    split = 134217729.0 * amounts
+    high = split - (split - amounts)
+    low = amounts - high
+    error = (high * 100 - scaled) + low * 100
+    whole = np.floor(scaled)
+    above_half = (scaled - whole - 0.5) + error
+    whole = whole.astype(np.int64)
+    return whole + (above_half > 0) + ((above_half == 0) & (whole % 2 == 1))
+
+
+def format_currency_column(values):
+    """
+    Versão vetorizada de `format_currency` para uma coluna inteira, com o mesmo
+    resultado. Os dígitos, separadores e prefixo são escritos como códigos de
+    caractere em uma matriz (uma linha por valor), convertida de uma vez em
+    strings, sem formatar célula a célula.
+    """
+    values = np.asarray(values, dtype=float)
+    units, cents = np.divmod(_round_cents(np.abs(values)), 100)
+    negative = np.signbit(values)
+
+    n_digits = np.ones(len(values), dtype=np.int64)
+    power = 10
+    while power <= units.max(initial=0):
+        n_digits += units >= power
+        power *= 10
+
+    # "R$ " + sinal + dígitos com "." a cada três + ",cc"
+    lengths = 3 + negative + n_digits + (n_digits - 1) // 3 + 3
+    chars = np.zeros((len(values), lengths.max(initial=7)), dtype=np.uint32)
+    rows = np.arange(len(values))
+    last = lengths - 1
+    chars[rows, last] = ord("0") + cents % 10
+    chars[rows, last - 1] = ord("0") + cents // 10
+    chars[rows, last - 2] = ord(",")
+    for k in range(int(n_digits.max(initial=1))):
+        has = n_digits > k
+        column = last[has] - 3 - k - k // 3
+        chars[rows[has], column] = ord("0") + (units[has] // 10 ** k) % 10
+        if k and k % 3 == 0:
+            chars[rows[has], column + 1] = ord(".")
+    chars[:, :3] = [ord(c) for c in "R$ "]
+    chars[negative, 3] = ord("-")
+    return chars.view(f"U{chars.shape[1]}").ravel()
+
+
+def _format_count(value):
+    return f"{value:,}".replace(",", ".")
+
+
+def format_table(df):
+    """Cópia do DataFrame com as colunas monetárias formatadas para exibição."""
+    formatted = df.copy()
+    for column in CURRENCY_COLUMNS:
+        if column in formatted:
+            formatted[column] = format_currency_column(formatted[column])
+    return formatted
+
+
+# --- INTERFACE ---
+
+def render_scenario_grid(scenarios):
+    """
+    Tabela de cenários salvos: filtros, ordenação, resumo e paginação são feitos
+    no servidor, e apenas a página visível é enviada ao navegador.
+    """
+    df = scenarios_frame(scenarios, st.session_state)
+
+    col_f1, col_f2, col_f3, col_f4 = st.columns([2, 1.2, 1.2, 0.8])
+    with col_f1:
+        horizons = st.multiselect(
+            "Filtrar por prazo (meses)", np.unique(df[MONTHS]).tolist(),
+            placeholder="Todos os prazos"
+        )
+    with col_f2:
+        min_difference = st.number_input("Diferença mínima (R$)", value=None, step=10000.0, placeholder="Sem limite")
+    with col_f3:
+        sort_by = st.selectbox("Ordenar por", SORTABLE_COLUMNS)
+    with col_f4:
+        descending = st.toggle("Decrescente", value=True)
+
+    filtered = filter_scenarios(df, horizons, min_difference)
+    if filtered.empty:
+        st.info("Nenhum cenário salvo atende aos filtros.")
+        return
+
+    summary = summarize_scenarios(filtered)
+    cols_summary = st.columns(4)
+    cols_summary[0].metric("Cenários Filtrados", _format_count(summary['count']), help=f"De {_format_count(len(df))} cenários salvos.")
+    cols_summary[1].metric("Melhor Diferença", format_currency(summary['best'][DIFFERENCE]), help=f"Cenário nº {summary['best_id']}, prazo de {summary['best'][MONTHS]} meses.")
+    cols_summary[2].metric("Pior Diferença", format_currency(summary['worst'][DIFFERENCE]), help=f"Cenário nº {summary['worst_id']}, prazo de {summary['worst'][MONTHS]} meses.")
+    cols_summary[3].metric("Construção mais Rentável em", f"{summary['construction_wins'] * 100:.1f}% dos cenários")
+
+    with st.expander("📊 Média por Prazo"):
+        st.dataframe(format_table(average_by_horizon(filtered)), hide_index=True, use_container_width=True)
+
+    col_p1, col_p2 = st.columns([1, 1])
+    with col_p2:
+        page_size = st.selectbox("Linhas por página", PAGE_SIZES, index=1)
+    total_pages = -(-len(filtered) // page_size)
+    with col_p1:
+        page = st.number_input("Página", min_value=1, max_value=total_pages, value=1, step=1)
+
+    page_df = page_of(filtered, sort_by, not descending, page, page_size)
+    st.dataframe(format_table(page_df), hide_index=True, use_container_width=True)
+    first_row = (page - 1) * page_size + 1
+    st.caption(
+        f"Exibindo {_format_count(first_row)}–{_format_count(first_row + len(page_df) - 1)} de "
+        f"{_format_count(len(filtered))} cenários filtrados · página {page} de {_format_count(total_pages)}."
+    )
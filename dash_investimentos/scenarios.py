@@ -0,0 +1,204 @@
+from collections import namedtuple
+
+from calculations import (
+    calculate_consortium_operation, calculate_funding_mix, calculate_scenario_1, calculate_scenario_2
+)
+from charts import (
+    build_cash_flow_figure, build_evolution_figure, build_final_comparison_figure, build_funding_mix_figure,
+    build_growth_figure, build_land_growth_figure, build_profit_comparison_figure, build_tax_benefit_figure
+)
+from scenario_cache import UrlParam
+
+# --- PARÂMETROS DAS PÁGINAS ---
+
+# Widgets compartilhados pelas páginas: custos da obra, prazo, impostos e sensibilidade.
+# Os limites máximos (iguais aos dos widgets) mantêm os cálculos finitos mesmo
+# com os valores extremos que um link compartilhado possa trazer.
+CONSTRUCTION_URL_PARAMS = {
+    'use_m2_pricing': UrlParam(True),
+    'land_area_m2': UrlParam(1003.0, 1.0, 1_000_000.0),
+    'construction_area_m2': UrlParam(456.0, 1.0, 1_000_000.0),
+    'land_cost_per_m2': UrlParam(1100, 0, 1_000_000),
+    'construction_cost_per_m2': UrlParam(4800, 0, 1_000_000),
+    'sale_price_per_m2': UrlParam(11000, 0, 1_000_000),
+    'land_cost': UrlParam(1100000, 0, 1_000_000_000),
+    'construction_cost': UrlParam(2200000, 0, 1_000_000_000),
+    'sale_price': UrlParam(4500000, 10000, 1_000_000_000),
+    'months': UrlParam(18, 1, 600),
+    'apply_sale_tax': UrlParam(True),
+    'corporate_tax_rate': UrlParam(25.0, 0.0, 100.0),
+    'monthly_rate': UrlParam(1.176, 0.5, 3.0),
+    'sale_price_variation': UrlParam(0, -20, 20),
+    'construction_cost_variation': UrlParam(0, -20, 20),
+}
+
+# Só um dos dois grupos de custos é usado (e publicado na URL), conforme `use_m2_pricing`.
+M2_PRICING_PARAMS = ('land_area_m2', 'construction_area_m2', 'land_cost_per_m2', 'construction_cost_per_m2', 'sale_price_per_m2')
+TOTAL_PRICING_PARAMS = ('land_cost', 'construction_cost', 'sale_price')
+
+CAPITAL_PROPRIO_URL_PARAMS = {'initial_investment': UrlParam(3300000, 10000, 1_000_000_000), **CONSTRUCTION_URL_PARAMS}
+
+CONSORCIO_URL_PARAMS = {
+    'consortium_loan': UrlParam(2200000, 10000, 1_000_000_000),
+    **CONSTRUCTION_URL_PARAMS,
+    'consortium_interest_rate': UrlParam(9.5, 0.0, 25.0),
+}
+
+FUNDING_MIX_URL_PARAMS = {
+    'initial_investment': UrlParam(3300000, 10000, 1_000_000_000),
+    'consortium_loan': UrlParam(2200000, 10000, 1_000_000_000),
+    **CONSTRUCTION_URL_PARAMS,
+    'consortium_interest_rate': UrlParam(9.5, 0.0, 25.0),
+}
+
+
+def project_costs(values):
+    """Retorna (terreno, construção, venda) a partir dos valores dos widgets, por m² ou totais."""
+    if values['use_m2_pricing']:
+        return (
+            values['land_cost_per_m2'] * values['land_area_m2'],
+            values['construction_cost_per_m2'] * values['construction_area_m2'],
+            values['sale_price_per_m2'] * values['construction_area_m2'],
+        )
+    return values['land_cost'], values['construction_cost'], values['sale_price']
+
+
+def capital_proprio_params(values):
+    """Monta o dicionário de parâmetros de `calculate_scenario_2` a partir dos widgets."""
+    land_cost, construction_cost, sale_price = project_costs(values)
+    return {
+        'initial_investment': values['initial_investment'], 'land_cost': land_cost,
+        'construction_cost_input': construction_cost,
+        'sale_price': sale_price, 'monthly_rate': values['monthly_rate'] / 100, 'months': values['months'],
+        'corporate_tax_rate': values['corporate_tax_rate'], 'apply_sale_tax': values['apply_sale_tax'],
+        'sale_price_variation': values['sale_price_variation'],
+        'construction_cost_variation': values['construction_cost_variation']
+    }
+
+
+def consortium_params(values):
+    """Monta o dicionário de parâmetros de `calculate_consortium_operation` a partir dos widgets."""
+    land_cost, construction_cost, sale_price = project_costs(values)
+    return {
+        'consortium_loan': values['consortium_loan'], 'land_cost': land_cost,
+        'construction_cost_input': construction_cost, 'sale_price': sale_price,
+        'monthly_rate': values['monthly_rate'] / 100, 'months': values['months'],
+        'consortium_interest_rate': values['consortium_interest_rate'],
+        'corporate_tax_rate': values['corporate_tax_rate'], 'apply_sale_tax': values['apply_sale_tax'],
+        'sale_price_variation': values['sale_price_variation'],
+        'construction_cost_variation': values['construction_cost_variation']
+    }
+
+
+def funding_mix_params(values):
+    """Monta o dicionário de parâmetros de `calculate_funding_mix`: a união dos parâmetros das duas páginas."""
+    return {**capital_proprio_params(values), **consortium_params(values)}
+
+
+# --- SIMULAÇÕES COMPLETAS ---
+# Os resultados contêm apenas tipos nativos do Python (históricos como listas por
+# coluna e gráficos como dicionários), para que ler o cache em disco não exija
+# carregar pandas, numpy ou plotly.
+
+def simulate_capital_proprio(params):
+    """Executa os dois cenários da página Capital Próprio e monta seus gráficos."""
+    months = params['months']
+    final_s1, tax_s1, history_s1 = calculate_scenario_1(params['initial_investment'], params['monthly_rate'], months)
+    final_s2, history_s2, tax_details, effective_sale_price, final_surplus_s2, tax_s2_income = calculate_scenario_2(params)
+
+    final_fund_balance_s2 = float(history_s2.iloc[-1]['Saldo do Fundo (R$)'])
+    gross_final_s2 = final_fund_balance_s2 + effective_sale_price + final_surplus_s2
+
+    s2_timeline = history_s2.copy()
+    s2_timeline.rename(columns={'Saldo do Fundo (R$)': 'Evolução Construção (R$)'}, inplace=True)
+    if months > 0:
+        s2_timeline.loc[s2_timeline['Mês'] == months, 'Evolução Construção (R$)'] = gross_final_s2
+
+    economia = tax_details['Economia de Imposto (Empresa)']
+    investimento_liquido = params['initial_investment'] - economia if params['initial_investment'] > 0 else 0
+    final_s2_total_benefit = final_s2 + economia
+
+    return {
+        'final_s1': float(final_s1), 'tax_s1': float(tax_s1), 'history_s1': history_s1.to_dict('list'),
+        'final_s2': float(final_s2), 'history_s2': history_s2.to_dict('list'),
+        'tax_details': {name: float(value) for name, value in tax_details.items()},
+        'effective_sale_price': float(effective_sale_price), 'final_surplus_s2': float(final_surplus_s2),
+        'tax_s2_income': float(tax_s2_income), 'final_fund_balance_s2': final_fund_balance_s2,
+        'gross_final_s2': float(gross_final_s2), 'final_s2_total_benefit': float(final_s2_total_benefit),
+        'figures': {
+            'rf': build_growth_figure(history_s1, months).to_dict(),
+            'comp_evolucao': build_evolution_figure(history_s1, s2_timeline).to_dict(),
+            'fiscal': build_tax_benefit_figure(economia, investimento_liquido).to_dict(),
+            'comp_bar': build_final_comparison_figure(final_s1, final_s2_total_benefit).to_dict(),
+        }
+    }
+
+
+def simulate_consortium(params):
+    """Executa a aplicação do terreno e a operação com consórcio, com seus gráficos."""
+    capital_proprio = params['land_cost']
+    final_s1, tax_s1, history_s1 = calculate_scenario_1(capital_proprio, params['monthly_rate'], params['months'])
+    final_s2, details, history_s2_df = calculate_consortium_operation(params)
+    return {
+        'final_s1': float(final_s1), 'tax_s1': float(tax_s1), 'history_s1': history_s1.to_dict('list'),
+        'final_s2': float(final_s2), 'details_s2': {name: float(value) for name, value in details.items()},
+        'history_s2_df': history_s2_df.to_dict('list'),
+        'figures': {
+            'rf': build_land_growth_figure(history_s1).to_dict(),
+            'comp_evolucao': build_cash_flow_figure(history_s1, history_s2_df, details, params['months']).to_dict(),
+            'comp_bar': build_profit_comparison_figure(final_s1 - capital_proprio, final_s2 - capital_proprio).to_dict(),
+        }
+    }
+
+
+def best_funding_mix_rows(mix_df):
+    """Índices das linhas com maior TIR e com maior lucro líquido (None se a coluna não tem valor definido)."""
+    def best_row(column):
+        return int(mix_df[column].idxmax()) if mix_df[column].notna().any() else None
+
+    return best_row('TIR Anual (%)'), best_row('Lucro Líquido (R$)')
+
+
+def simulate_funding_mix(params):
+    """Varre a participação do consórcio na obra de 0% a 100% e compara com a renda fixa."""
+    mix_df = calculate_funding_mix(params)
+    months = params['months']
+    # TIR líquida da renda fixa: independe do capital aplicado, então basta simular R$ 1,00.
+    final_unit, _, _ = calculate_scenario_1(1.0, params['monthly_rate'], months)
+    fixed_income_irr = float((final_unit ** (12 / months) - 1) * 100) if months > 0 else 0.0
+
+    best_irr, best_profit = best_funding_mix_rows(mix_df)
+
+    def row(index):
+        return None if index is None else {name: float(value) for name, value in mix_df.iloc[index].items()}
+
+    return {
+        'mix': mix_df.to_dict('list'),
+        'best_irr': row(best_irr),
+        'best_profit': row(best_profit),
+        'fixed_income_irr': fixed_income_irr,
+        'figures': {
+            'mix': build_funding_mix_figure(mix_df, fixed_income_irr, best_irr, best_profit).to_dict(),
+        }
+    }
+
+
+# --- REGISTRO DAS PÁGINAS ---
+
+ScenarioPage = namedtuple("ScenarioPage", ["page_id", "url_params", "build_params", "simulate"])
+
+CAPITAL_PROPRIO = ScenarioPage("capital_proprio", CAPITAL_PROPRIO_URL_PARAMS, capital_proprio_params, simulate_capital_proprio)
+CONSORCIO = ScenarioPage("consorcio", CONSORCIO_URL_PARAMS, consortium_params, simulate_consortium)
+MIX_FINANCIAMENTO = ScenarioPage("mix_financiamento", FUNDING_MIX_URL_PARAMS, funding_mix_params, simulate_funding_mix)
+
+PAGES = (CAPITAL_PROPRIO, CONSORCIO, MIX_FINANCIAMENTO)
+
+
+def page_url_values(page, inputs):
+    """
+    Seleciona, dos valores dos widgets (`inputs`, indexado pelo nome do parâmetro),
+    os que a página publica na URL: todos os seus parâmetros, com os custos por m²
+    ou os custos totais, conforme o modo de cálculo escolhido.
+    """
+    unused = TOTAL_PRICING_PARAMS if inputs['use_m2_pricing'] else M2_PRICING_PARAMS
+    return {name: inputs[name] for name in page.url_params if name not in unused}
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Os módulos do app são importados pelo nome, como faz o `streamlit run` a partir de dash_investimentos/.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
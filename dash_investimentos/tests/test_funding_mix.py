@@ -0,0 +1,52 @@
+"""
+O modelo de mix de financiamento deve coincidir, nos extremos, com os cálculos
+das outras páginas: 0% de consórcio com `calculate_scenario_2` somado à economia
+de imposto e 100% de consórcio com `calculate_consortium_operation`.
+"""
+import math
+
+import pytest
+
+from calculations import calculate_consortium_operation, calculate_funding_mix, calculate_scenario_2
+from scenarios import best_funding_mix_rows
+
+BASE_PARAMS = {
+    'initial_investment': 3300000, 'consortium_loan': 2200000, 'land_cost': 1103300.0,
+    'construction_cost_input': 2188800.0, 'sale_price': 5016000.0, 'monthly_rate': 0.01176, 'months': 18,
+    'consortium_interest_rate': 9.5, 'corporate_tax_rate': 25.0, 'apply_sale_tax': True,
+    'sale_price_variation': 0, 'construction_cost_variation': 0,
+}
+
+CASES = {
+    'padrão': {},
+    'excedente de investimento': {'initial_investment': 9000000},
+    'investimento menor que a obra': {'initial_investment': 500000},
+    'carta maior que a obra': {'consortium_loan': 4000000, 'consortium_interest_rate': 25.0},
+    'obra mais cara e venda menor': {'construction_cost_variation': 20, 'sale_price_variation': -20},
+    'lucro acima de R$ 5 milhões': {'sale_price': 15000000},
+}
+
+
+@pytest.mark.parametrize("apply_sale_tax", [True, False])
+@pytest.mark.parametrize("months", [1, 18, 120, 360])
+@pytest.mark.parametrize("case", list(CASES))
+def test_funding_mix_matches_both_pages_at_the_endpoints(case, months, apply_sale_tax):
+    params = {**BASE_PARAMS, **CASES[case], 'months': months, 'apply_sale_tax': apply_sale_tax}
+    mix_df = calculate_funding_mix(params, [0, 1])
+    own_capital_result, consortium_result = mix_df['Resultado Líquido (R$)']
+
+    final_s2, _, tax_details, _, _, _ = calculate_scenario_2(params)
+    expected_own_capital = final_s2 + tax_details['Economia de Imposto (Empresa)']
+    expected_consortium, _, _ = calculate_consortium_operation(params)
+
+    assert math.isclose(own_capital_result, expected_own_capital, rel_tol=1e-12)
+    assert math.isclose(consortium_result, expected_consortium, rel_tol=1e-12)
+
+
+def test_best_rows_are_none_when_a_column_is_undefined():
+    mix_df = calculate_funding_mix(BASE_PARAMS, [0, 0.5, 1])
+    assert best_funding_mix_rows(mix_df) == (2, int(mix_df['Lucro Líquido (R$)'].idxmax()))
+
+    mix_df['TIR Anual (%)'] = float('nan')
+    mix_df['Lucro Líquido (R$)'] = float('nan')
+    assert best_funding_mix_rows(mix_df) == (None, None)
@@ -0,0 +1,28 @@
+"""
+`format_currency_column` deve produzir exatamente o mesmo texto que
+`format_currency` aplicada valor a valor.
+"""
+import random
+
+import pytest
+
+from calculations import format_currency
+from scenario_grid import format_currency_column
+
+TIES = [8082.315, 0.005, 0.015, 0.125, 2.675, 1.005, 1234567.885]
+SIGNED = [0.0, -0.0, -0.001, -0.005, -1.0, -8082.315, -999.995, -1234567.89]
+LARGE = [999.995, 999999.995, 1e9 + 0.5, 1e12, 123456789012.34, 2.0 ** 53 / 100]
+
+
+def _random_values():
+    rng = random.Random(0)
+    return [rng.randrange(-10**10, 10**10) / 1000 for _ in range(5000)]
+
+
+@pytest.mark.parametrize("values", [TIES, SIGNED, LARGE, _random_values()], ids=["empates", "sinais", "grandes", "aleatorios"])
+def test_matches_format_currency(values):
+    assert list(format_currency_column(values)) == [format_currency(v) for v in values]
+
+
+def test_empty_column():
+    assert len(format_currency_column([])) == 0
@@ -0,0 +1,89 @@
+import os
+import time
+
+from scenario_cache import STALE_TMP_SECONDS, ScenarioStore
+
+
+def _disk_bytes(directory):
+    return sum(path.stat().st_size for path in directory.glob("*/*.pkl"))
+
+
+def _key(i):
+    return f"{i:064x}"
+
+
+def test_put_and_get_round_trip(tmp_path):
+    store = ScenarioStore(tmp_path)
+    store.put(_key(1), {'final': 1.5, 'history': [1, 2, 3]})
+    assert store.get(_key(1)) == {'final': 1.5, 'history': [1, 2, 3]}
+    assert store.get(_key(2)) is None
+
+
+def test_running_total_matches_the_disk(tmp_path):
+    store = ScenarioStore(tmp_path)
+    for i in range(20):
+        store.put(_key(i), b"x" * (100 * i))
+    # Regravar uma chave substitui o tamanho antigo em vez de somá-lo.
+    store.put(_key(5), b"y" * 10)
+    store.put(_key(6), b"y" * 5000)
+    assert store._total_bytes == _disk_bytes(tmp_path)
+
+
+def test_directory_is_scanned_only_on_the_first_put_and_when_over_budget(tmp_path, monkeypatch):
+    store = ScenarioStore(tmp_path, max_bytes=50_000)
+    scans = []
+    original_scan = store._scan
+    monkeypatch.setattr(store, "_scan", lambda: scans.append(1) or original_scan())
+
+    for i in range(40):
+        store.put(_key(i), b"x" * 1000)
+    assert len(scans) == 1
+
+    for i in range(40, 80):
+        store.put(_key(i), b"x" * 1000)
+    # A margem de EVICTION_LOW_WATER evita varrer o diretório a cada gravação.
+    assert 1 < len(scans) <= 40 // 4
+    assert store._total_bytes == _disk_bytes(tmp_path) <= store.max_bytes
+
+
+def test_eviction_removes_the_least_recently_used_entries(tmp_path):
+    store = ScenarioStore(tmp_path, max_bytes=10**9)
+    for i in range(10):
+        store.put(_key(i), b"x" * 1000)
+        os.utime(store._path(_key(i)), (1000 + i, 1000 + i))
+    # Ler uma entrada antiga a torna a mais recente.
+    assert store.get(_key(0)) is not None
+
+    store.max_bytes = 5 * 1100
+    store.put(_key(10), b"x" * 1000)
+
+    remaining = {path.stem for path in tmp_path.glob("*/*.pkl")}
+    assert _key(0) in remaining and _key(10) in remaining
+    assert _key(1) not in remaining and _key(2) not in remaining
+    assert store._total_bytes == _disk_bytes(tmp_path) <= store.max_bytes
+
+
+def test_eviction_sweeps_stale_temporary_files(tmp_path):
+    store = ScenarioStore(tmp_path, max_bytes=3000)
+    store.put(_key(1), b"x")
+    stale = tmp_path / "00" / "stale.tmp"
+    fresh = tmp_path / "00" / "fresh.tmp"
+    stale.parent.mkdir(exist_ok=True)
+    stale.write_bytes(b"x" * 100)
+    fresh.write_bytes(b"x" * 100)
+    old = time.time() - STALE_TMP_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    for i in range(2, 10):
+        store.put(_key(i), b"x" * 1000)
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_corrupt_entries_are_discarded(tmp_path):
+    store = ScenarioStore(tmp_path)
+    store.put(_key(1), [1, 2, 3])
+    store._path(_key(1)).write_bytes(b"not a pickle")
+    assert store.get(_key(1)) is None
+    assert not store._path(_key(1)).exists()
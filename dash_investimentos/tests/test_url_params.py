@@ -0,0 +1,46 @@
+import pytest
+
+from scenario_cache import UrlParam, _decode_value
+from scenarios import PAGES
+
+MONTHS = UrlParam(18, 1, 600)
+RATE = UrlParam(1.176, 0.5, 3.0)
+AREA = UrlParam(1003.0, 1.0, 1_000_000.0)
+AMOUNT = UrlParam(1100000, 0, 1_000_000_000)
+
+
+@pytest.mark.parametrize("raw", ["nan", "NaN", "inf", "-inf", "Infinity", "1e400"])
+@pytest.mark.parametrize("spec", [MONTHS, RATE, AREA, AMOUNT])
+def test_non_finite_values_fall_back_to_the_default(raw, spec):
+    assert _decode_value(raw, spec) == spec.default
+
+
+@pytest.mark.parametrize("spec, raw", [
+    (MONTHS, "0"), (MONTHS, "601"), (MONTHS, "1000000000"),
+    (RATE, "0.49"), (RATE, "3.01"),
+    (AREA, "0.5"), (AREA, "1e305"),
+    (AMOUNT, "-1"), (AMOUNT, "1000000001"), (AMOUNT, "1e20"),
+])
+def test_out_of_range_values_fall_back_to_the_default(spec, raw):
+    assert _decode_value(raw, spec) == spec.default
+
+
+@pytest.mark.parametrize("raw", ["", "abc", "1,5", "0x10"])
+def test_invalid_text_falls_back_to_the_default(raw):
+    assert _decode_value(raw, RATE) == RATE.default
+
+
+def test_valid_values_keep_the_type_of_the_default():
+    assert _decode_value("600", MONTHS) == 600
+    assert isinstance(_decode_value("24.0", MONTHS), int)
+    assert _decode_value("2.5", RATE) == 2.5
+    assert _decode_value("1000000000", AMOUNT) == 1_000_000_000
+    assert _decode_value("0", UrlParam(True)) is False
+    assert _decode_value("1", UrlParam(False)) is True
+
+
+def test_every_numeric_url_parameter_is_bounded():
+    for page in PAGES:
+        for name, spec in page.url_params.items():
+            if not isinstance(spec.default, bool):
+                assert spec.min_value is not None and spec.max_value is not None, (page.page_id, name)
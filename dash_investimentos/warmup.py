@@ -0,0 +1,39 @@
+"""
+Pré-aquecimento do simulador.
+
+Calcula os cenários padrão de todas as páginas e grava no cache em disco, de modo
+que a primeira visita após um deploy ou reinício do contêiner seja servida sem
+cálculo. Pode ser executado antes de iniciar o servidor:
+
+    python dash_investimentos/warmup.py && streamlit run dash_investimentos/Home.py
+
+e também roda uma vez por processo do servidor, a partir da página inicial.
+"""
+import time
+
+import streamlit as st
+
+from scenario_cache import default_values, get_store, scenario_key, store_from_env
+from scenarios import PAGES
+
+
+def warm_up(store):
+    """Garante que o cenário padrão de cada página esteja no cache. Retorna o tempo por página (s)."""
+    timings = {}
+    for page in PAGES:
+        start = time.perf_counter()
+        params = page.build_params(default_values(page.url_params))
+        store.get_or_compute(scenario_key(page.page_id, params), lambda: page.simulate(params))
+        timings[page.page_id] = time.perf_counter() - start
+    return timings
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up_server():
+    """Executa o pré-aquecimento uma única vez por processo do servidor."""
+    return warm_up(get_store())
+
+
+if __name__ == "__main__":
+    for page_id, seconds in warm_up(store_from_env()).items():
+        print(f"{page_id}: cenário padrão em cache ({seconds * 1000:.0f} ms)")